@@ -58,9 +58,26 @@ notifications_url: Final[str] = api_base_url + '/notifications'
 verify_ssl: Final[bool] = True
 connect_timeout: Final[int] = 2  # in seconds
 read_timeout: Final[int] = 4  # in seconds
+# maximum number of pooled connections held by the shared HTTP client session
+max_connections: Final[int] = 4
+# maximum number of requests concurrently in flight; further requests queue
+max_parallel_requests: Final[int] = 6
+# number of automatic retries on transient gateway errors (502/503/504)
+request_retries: Final[int] = 2
+# base delay in seconds between those retries (doubled per attempt)
+request_retry_backoff: Final[float] = 0.3
+# batching window in seconds for sendDataBatched; payloads posted to the
+# same endpoint within this window are sent as a single batch request
+post_batch_delay: Final[float] = 0.01
+# maximum number of payloads per batch; a full batch is flushed immediately
+post_batch_max: Final[int] = 10
 min_passwd_len: Final[int] = 4
 min_login_len: Final[int] = 6
 compress_posts: Final[bool] = True
+# if True and the zstandard module is available, POST bodies above the
+# compression threshold are compressed with zstd instead of gzip
+# NOTE: enable only once the server announces Content-Encoding zstd support
+compress_posts_zstd: Final[bool] = False
 # post_compression_threshold holds the number in bytes before compression
 # kicks in
 # (data smaller than this are always send uncompressed via POST)
@@ -74,6 +91,8 @@ expired_subscription_max_days: Final[int] = 90
 # Cache and queue parameters
 
 stock_cache_expiration: Final[int] = 30  # expiration period in seconds
+# maximum number of entries held in the in-memory ETag response cache
+etag_cache_max_entries: Final[int] = 128
 
 queue_start_delay: Final[int] = 5  # startup time of queue in seconds
 # delay between tasks in seconds (cycling interval of the queue)